@@ -0,0 +1,46 @@
+"""Test-only SQLite fixtures for the deploy seed: seed a template once, clone per test."""
+
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import seed_deploy
+
+
+def build_sqlite_template(path, metadata):
+    """Create ``metadata``'s schema in a new SQLite file at ``path`` and seed it once."""
+    template_engine = create_engine(f"sqlite:///{path}")
+    try:
+        metadata.create_all(template_engine)
+        seed_deploy.seed_state_metadata.create_all(template_engine)
+        # A brand-new private file: no stamp to honour and no one to lock out.
+        seed_deploy.seed_data(
+            force=True,
+            use_lock=False,
+            session_factory=sessionmaker(
+                autocommit=False, autoflush=False, bind=template_engine),
+        )
+    finally:
+        template_engine.dispose()
+    return path
+
+
+def sqlite_engine_from_template(path):
+    """Return an engine bound to a fresh in-memory copy of the template (backup API)."""
+    source = sqlite3.connect(str(path))
+    try:
+        clone = sqlite3.connect(":memory:", check_same_thread=False)
+        source.backup(clone)
+    finally:
+        source.close()
+    return create_engine("sqlite://", creator=lambda: clone, poolclass=StaticPool)
+
+
+@pytest.fixture(scope="session")
+def seeded_template(tmp_path_factory):
+    path = tmp_path_factory.mktemp("seed") / "template.db"
+    return build_sqlite_template(path, seed_deploy.base_seed.Activity.metadata)
+
@@ -8,16 +8,75 @@ This script clears existing demo data and then loads ONLY:
   • the selected activities linked to those types
 
 All other tables remain empty (aside from schema) after seeding.
+
+A ``seed_state`` stamp records a fingerprint of the seeded manifest and the Alembic
+revision; when both still match, the script exits without touching the data (pass
+``--force`` to reseed anyway). The table comes from a migration; without it the
+script still seeds, just without stamping.
+
+Bulk course provisioning (no reset) runs against an already seeded catalog:
+
+    python seed_data/seed_deploy.py courses --count 300 --teacher-email t@school.org
+
+Seeding a slice of the catalog (dependencies such as activity types and the
+system-default activity are pulled in automatically):
+
+    python seed_data/seed_deploy.py --tag unit-1 --survey "Learning Buddy: Style Check"
+
+Large databases can be reset in bounded batches (short transactions, no table
+locks held across the whole purge) instead of one sweeping reset:
+
+    python seed_data/seed_deploy.py --batched-reset 5000
+
+Profiling a slow seed (per-phase timing, peak memory, cProfile dump, folded stacks
+for flamegraph.pl or speedscope):
+
+    python seed_data/seed_deploy.py --trace-memory --profile seed.prof --flamegraph seed.folded
+
+``--metrics seed.prom`` writes per-phase wall time, SQL statement counts and DB time
+in Prometheus text format (e.g. for the node_exporter textfile collector).
 """
 
 from __future__ import annotations
 
+import argparse
+import copy
+import cProfile
+import hashlib
+import json
+import math
+import os
 import sys
+import threading
+import time
+import tracemalloc
 import uuid
+import warnings
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
-from sqlalchemy import create_engine
+from sqlalchemy import (
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    column,
+    create_engine,
+    delete,
+    event,
+    func,
+    inspect as sqlalchemy_inspect,
+    insert,
+    literal,
+    select,
+    table,
+    tuple_,
+)
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 # Allow importing the app package when running as a script.
@@ -32,1204 +91,2135 @@ SQLALCHEMY_DATABASE_URL = settings.database_url
 engine = create_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+BULK_INSERT_BATCH_SIZE = 500
+# Page size SQLAlchemy uses when batching ORM inserts of one table.
+ORM_INSERT_BATCH_SIZE = 1000
 
-def seed_surveys(db: Session) -> None:
-    """Insert the two legacy survey templates (Critter Quest then Learning Buddy)."""
-    survey_1_questions: List[dict] = [
-        {
-            "id": "q1",
-            "text": "When I can move or use my hands, I learn better.",
-            "options": [
-                {
-                    "label": "1 — Not at all",
-                    "scores": {
-                        "Active learner": 1,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+SYSTEM_DEFAULT_TAG = "__system_default__"
+SEED_CREATOR_EMAIL = "seed@system.local"
+# Stable across reseeds so deploys can pin SYSTEM_DEFAULT_ACTIVITY_ID once and the
+# recommender's last fallback becomes a primary-key lookup instead of a tag scan.
+SYSTEM_DEFAULT_ACTIVITY_ID = str(
+    uuid.uuid5(uuid.NAMESPACE_URL, "classconnect:seed:system-default-activity")
+)
+DEFAULT_COURSE_SURVEY_TITLE = "Learning Buddy: Style Check"
+DEFAULT_COURSE_MOOD_LABELS = ["Happy", "Okay", "Tired", "Stressed"]
+
+
+SURVEY_1_QUESTIONS: List[dict] = [
+    {
+        "id": "q1",
+        "text": "When I can move or use my hands, I learn better.",
+        "options": [
+            {
+                "label": "1 — Not at all",
+                "scores": {
+                    "Active learner": 1,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "2 — A little",
-                    "scores": {
-                        "Active learner": 2,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "2 — A little",
+                "scores": {
+                    "Active learner": 2,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "3 — Not sure",
-                    "scores": {
-                        "Active learner": 3,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "3 — Not sure",
+                "scores": {
+                    "Active learner": 3,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "4 — Mostly",
-                    "scores": {
-                        "Active learner": 4,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "4 — Mostly",
+                "scores": {
+                    "Active learner": 4,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "5 — Yes, a lot",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "5 — Yes, a lot",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-            ],
-        },
-        {
-            "id": "q2",
-            "text": "A short move break before learning helps me.",
-            "options": [
-                {
-                    "label": "1 — Not at all",
-                    "scores": {
-                        "Active learner": 1,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q2",
+        "text": "A short move break before learning helps me.",
+        "options": [
+            {
+                "label": "1 — Not at all",
+                "scores": {
+                    "Active learner": 1,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "2 — A little",
-                    "scores": {
-                        "Active learner": 2,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "2 — A little",
+                "scores": {
+                    "Active learner": 2,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "3 — Not sure",
-                    "scores": {
-                        "Active learner": 3,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "3 — Not sure",
+                "scores": {
+                    "Active learner": 3,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "4 — Mostly",
-                    "scores": {
-                        "Active learner": 4,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "4 — Mostly",
+                "scores": {
+                    "Active learner": 4,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "5 — Yes, a lot",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "5 — Yes, a lot",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-            ],
-        },
-        {
-            "id": "q3",
-            "text": "Pictures or step cards make things clear for me.",
-            "options": [
-                {
-                    "label": "1 — Not at all",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 1,
-                        "Passive learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q3",
+        "text": "Pictures or step cards make things clear for me.",
+        "options": [
+            {
+                "label": "1 — Not at all",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 1,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "2 — A little",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 2,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "2 — A little",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 2,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "3 — Not sure",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 3,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "3 — Not sure",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 3,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "4 — Mostly",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 4,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "4 — Mostly",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 4,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "5 — Yes, a lot",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 5,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "5 — Yes, a lot",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 5,
+                    "Passive learner": 0,
                 },
-            ],
-        },
-        {
-            "id": "q4",
-            "text": "A clear checklist or plan helps me focus.",
-            "options": [
-                {
-                    "label": "1 — Not at all",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 1,
-                        "Passive learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q4",
+        "text": "A clear checklist or plan helps me focus.",
+        "options": [
+            {
+                "label": "1 — Not at all",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 1,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "2 — A little",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 2,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "2 — A little",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 2,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "3 — Not sure",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 3,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "3 — Not sure",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 3,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "4 — Mostly",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 4,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "4 — Mostly",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 4,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "5 — Yes, a lot",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 5,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "5 — Yes, a lot",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 5,
+                    "Passive learner": 0,
                 },
-            ],
-        },
-        {
-            "id": "q5",
-            "text": "My energy right now is…",
-            "options": [
-                {
-                    "label": "1 — Very low",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 5,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q5",
+        "text": "My energy right now is…",
+        "options": [
+            {
+                "label": "1 — Very low",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 5,
                 },
-                {
-                    "label": "2 — Low",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 4,
-                    },
+            },
+            {
+                "label": "2 — Low",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 4,
                 },
-                {
-                    "label": "3 — Okay",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 3,
-                    },
+            },
+            {
+                "label": "3 — Okay",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 3,
                 },
-                {
-                    "label": "4 — High",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 2,
-                    },
+            },
+            {
+                "label": "4 — High",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 2,
                 },
-                {
-                    "label": "5 — Very high",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 1,
-                    },
+            },
+            {
+                "label": "5 — Very high",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 1,
                 },
-            ],
-        },
-        {
-            "id": "q6",
-            "text": "My worry right now is…",
-            "options": [
-                {
-                    "label": "1 — Not worried",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 1,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q6",
+        "text": "My worry right now is…",
+        "options": [
+            {
+                "label": "1 — Not worried",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 1,
                 },
-                {
-                    "label": "2 — A little worried",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 2,
-                    },
+            },
+            {
+                "label": "2 — A little worried",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 2,
                 },
-                {
-                    "label": "3 — Somewhat worried",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 3,
-                    },
+            },
+            {
+                "label": "3 — Somewhat worried",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 3,
                 },
-                {
-                    "label": "4 — Quite worried",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 4,
-                    },
+            },
+            {
+                "label": "4 — Quite worried",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 4,
                 },
-                {
-                    "label": "5 — Very worried",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 5,
-                    },
+            },
+            {
+                "label": "5 — Very worried",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 5,
                 },
-            ],
-        },
-        {
-            "id": "q7",
-            "text": "What do you want to do first?",
-            "options": [
-                {
-                    "label": "A —  Move break",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q7",
+        "text": "What do you want to do first?",
+        "options": [
+            {
+                "label": "A —  Move break",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "B — Calm time",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 5,
-                    },
+            },
+            {
+                "label": "B — Calm time",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 5,
                 },
-                {
-                    "label": "C — Lesson preview",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 5,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "C — Lesson preview",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 5,
+                    "Passive learner": 0,
                 },
-            ],
-        },
-        {
-            "id": "q8",
-            "text": "When I get stuck, I like to…",
-            "options": [
-                {
-                    "label": "A — Try it with hands/body",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q8",
+        "text": "When I get stuck, I like to…",
+        "options": [
+            {
+                "label": "A — Try it with hands/body",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "B — Look at an example or steps",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 5,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "B — Look at an example or steps",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 5,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "C — Take a quiet minute first",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 5,
-                    },
+            },
+            {
+                "label": "C — Take a quiet minute first",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 5,
                 },
-            ],
-        },
-        {
-            "id": "q9",
-            "text": "Which starter helps you most today?",
-            "options": [
-                {
-                    "label": "A — Quick game / movement challenge",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q9",
+        "text": "Which starter helps you most today?",
+        "options": [
+            {
+                "label": "A — Quick game / movement challenge",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "B — Picture card of today's steps",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 5,
-                        "Passive learner": 0,
-                    },
+            },
+            {
+                "label": "B — Picture card of today's steps",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 5,
+                    "Passive learner": 0,
                 },
-                {
-                    "label": "C — Quiet breath + 30-sec video",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 5,
-                    },
+            },
+            {
+                "label": "C — Quiet breath + 30-sec video",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 5,
                 },
-            ],
-        },
-    ]
+            },
+        ],
+    },
+]
 
-    survey_2_questions: List[dict] = [
-        {
-            "id": "q1",
-            "text": "On a learning playground, I like to jump in and try things first.",
-            "options": [
-                {
-                    "label": "1 — Not me",
-                    "scores": {
-                        "Active learner": 1,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+SURVEY_2_QUESTIONS: List[dict] = [
+    {
+        "id": "q1",
+        "text": "On a learning playground, I like to jump in and try things first.",
+        "options": [
+            {
+                "label": "1 — Not me",
+                "scores": {
+                    "Active learner": 1,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "2 — A little me",
-                    "scores": {
-                        "Active learner": 2,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "2 — A little me",
+                "scores": {
+                    "Active learner": 2,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "3 — Sometimes me",
-                    "scores": {
-                        "Active learner": 3,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "3 — Sometimes me",
+                "scores": {
+                    "Active learner": 3,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "4 — Mostly me",
-                    "scores": {
-                        "Active learner": 4,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "4 — Mostly me",
+                "scores": {
+                    "Active learner": 4,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "5 — So me!",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "5 — So me!",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-            ],
-        },
-        {
-            "id": "q2",
-            "text": (
-                "A tiny action mission (e.g., 10 ninja steps or desk push-ups) helps my brain get "
-                "ready."
-            ),
-            "options": [
-                {
-                    "label": "1 — Not helpful",
-                    "scores": {
-                        "Active learner": 1,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q2",
+        "text": (
+            "A tiny action mission (e.g., 10 ninja steps or desk push-ups) helps my brain get "
+            "ready."
+        ),
+        "options": [
+            {
+                "label": "1 — Not helpful",
+                "scores": {
+                    "Active learner": 1,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "2 — A little helpful",
-                    "scores": {
-                        "Active learner": 2,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "2 — A little helpful",
+                "scores": {
+                    "Active learner": 2,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "3 — Not sure",
-                    "scores": {
-                        "Active learner": 3,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "3 — Not sure",
+                "scores": {
+                    "Active learner": 3,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "4 — Mostly helpful",
-                    "scores": {
-                        "Active learner": 4,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "4 — Mostly helpful",
+                "scores": {
+                    "Active learner": 4,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "5 — Super helpful",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "5 — Super helpful",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-            ],
-        },
-        {
-            "id": "q3",
-            "text": "Maps, recipe cards, or numbered pictures help me know what to do next.",
-            "options": [
-                {
-                    "label": "1 — Not me",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 1,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q3",
+        "text": "Maps, recipe cards, or numbered pictures help me know what to do next.",
+        "options": [
+            {
+                "label": "1 — Not me",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 1,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "2 — A little me",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 2,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "2 — A little me",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 2,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "3 — Sometimes me",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 3,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "3 — Sometimes me",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 3,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "4 — Mostly me",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 4,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "4 — Mostly me",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 4,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "5 — So me!",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 5,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "5 — So me!",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 5,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-            ],
-        },
-        {
-            "id": "q4",
-            "text": "Meeting in a small crew (1-2 people) helps me feel calm and ready.",
-            "options": [
-                {
-                    "label": "1 — Not really",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 1,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q4",
+        "text": "Meeting in a small crew (1-2 people) helps me feel calm and ready.",
+        "options": [
+            {
+                "label": "1 — Not really",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 1,
                 },
-                {
-                    "label": "2 — A little",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 2,
-                    },
+            },
+            {
+                "label": "2 — A little",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 2,
                 },
-                {
-                    "label": "3 — Not sure",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 3,
-                    },
+            },
+            {
+                "label": "3 — Not sure",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 3,
                 },
-                {
-                    "label": "4 — Yes",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 4,
-                    },
+            },
+            {
+                "label": "4 — Yes",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 4,
                 },
-                {
-                    "label": "5 — Definitely",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 5,
-                    },
+            },
+            {
+                "label": "5 — Definitely",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 5,
                 },
-            ],
-        },
-        {
-            "id": "q5",
-            "text": "If my energy feels wobbly, I like to…",
-            "options": [
-                {
-                    "label": "1 — Take a quiet break first",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 5,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q5",
+        "text": "If my energy feels wobbly, I like to…",
+        "options": [
+            {
+                "label": "1 — Take a quiet break first",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 5,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "2 — Talk to someone about it",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 5,
-                    },
+            },
+            {
+                "label": "2 — Talk to someone about it",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 5,
                 },
-                {
-                    "label": "3 — Do a movement challenge",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "3 — Do a movement challenge",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-            ],
-        },
-        {
-            "id": "q6",
-            "text": "When I get stuck, I like to…",
-            "options": [
-                {
-                    "label": "1 — Try it with hands/body",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q6",
+        "text": "When I get stuck, I like to…",
+        "options": [
+            {
+                "label": "1 — Try it with hands/body",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "2 — Look at example cards or a video",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 5,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "2 — Look at example cards or a video",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 5,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "3 — Ask a buddy to explain it with me",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 5,
-                    },
+            },
+            {
+                "label": "3 — Ask a buddy to explain it with me",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 5,
                 },
-                {
-                    "label": "4 — Take a quiet minute first",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 5,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "4 — Take a quiet minute first",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 5,
+                    "Buddy/Social learner": 0,
                 },
-            ],
-        },
-        {
-            "id": "q7",
-            "text": "Which starter helps you most today?",
-            "options": [
-                {
-                    "label": "1 — Quick game / movement challenge",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q7",
+        "text": "Which starter helps you most today?",
+        "options": [
+            {
+                "label": "1 — Quick game / movement challenge",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "2 — Picture card of today's steps",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 5,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "2 — Picture card of today's steps",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 5,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "3 — Quiet breath + 30-sec video",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 5,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "3 — Quiet breath + 30-sec video",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 5,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "4 — Buddy brainstorm",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 5,
-                    },
+            },
+            {
+                "label": "4 — Buddy brainstorm",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 5,
                 },
-            ],
-        },
-        {
-            "id": "q8",
-            "text": "If feedback is confusing, I like to…",
-            "options": [
-                {
-                    "label": "1 — Watch someone demo it again",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 5,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q8",
+        "text": "If feedback is confusing, I like to…",
+        "options": [
+            {
+                "label": "1 — Watch someone demo it again",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 5,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "2 — Talk through it with a buddy",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 5,
-                    },
+            },
+            {
+                "label": "2 — Talk through it with a buddy",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 5,
                 },
-                {
-                    "label": "3 — Try again with movement",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "3 — Try again with movement",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "4 — Take a calm minute first",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 5,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "4 — Take a calm minute first",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 5,
+                    "Buddy/Social learner": 0,
                 },
-            ],
-        },
-        {
-            "id": "q9",
-            "text": "Celebrating a win feels best when…",
-            "options": [
-                {
-                    "label": "1 — I can show or move the new skill",
-                    "scores": {
-                        "Active learner": 5,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+        ],
+    },
+    {
+        "id": "q9",
+        "text": "Celebrating a win feels best when…",
+        "options": [
+            {
+                "label": "1 — I can show or move the new skill",
+                "scores": {
+                    "Active learner": 5,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 0,
                 },
-                {
-                    "label": "2 — I tell someone about it",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 0,
-                        "Buddy/Social learner": 5,
-                    },
+            },
+            {
+                "label": "2 — I tell someone about it",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 0,
+                    "Buddy/Social learner": 5,
                 },
-                {
-                    "label": "3 — I keep a calm moment for myself",
-                    "scores": {
-                        "Active learner": 0,
-                        "Structured learner": 0,
-                        "Passive learner": 5,
-                        "Buddy/Social learner": 0,
-                    },
+            },
+            {
+                "label": "3 — I keep a calm moment for myself",
+                "scores": {
+                    "Active learner": 0,
+                    "Structured learner": 0,
+                    "Passive learner": 5,
+                    "Buddy/Social learner": 0,
                 },
-            ],
-        },
-    ]
-
-    survey_specs = [
-        {
-            "title": "Critter Quest: Learning Adventure",
-            "questions": survey_2_questions,
-        },
-        {
-            "title": "Learning Buddy: Style Check",
-            "questions": survey_1_questions,
-        },
-    ]
+            },
+        ],
+    },
+]
 
-    existing = {row.title: row for row in db.query(
-        base_seed.SurveyTemplate).all()}
-    for spec in survey_specs:
-        if spec["title"] in existing:
-            print(f"ℹ️  Survey already exists, skipping: {spec['title']}")
-            continue
-        survey = base_seed.SurveyTemplate(
-            id=str(uuid.uuid4()),
-            title=spec["title"],
-            questions_json=spec["questions"],
-            creator_name="System Seed",
-            creator_id=None,
-            creator_email="seed@system.local",
-        )
-        db.add(survey)
-        db.flush()
-        print(f"📝 Survey added: {survey.title}")
-    db.commit()
+SURVEY_SPECS: List[dict] = [
+    {
+        "title": "Critter Quest: Learning Adventure",
+        "questions": SURVEY_2_QUESTIONS,
+    },
+    {
+        "title": "Learning Buddy: Style Check",
+        "questions": SURVEY_1_QUESTIONS,
+    },
+]
 
 
-def seed_activity_types_and_activities(db: Session) -> Dict[str, base_seed.Activity]:
-    """Insert deploy activity types and associated activities."""
-    activity_type_seed_data = [
-        {
-            "type_name": "in-class-task",
-            "description": (
-                "Live classroom activity students do immediately (pair work, role-play, hands-on "
-                "practice)."
-            ),
-            "required_fields": ["steps"],
-            "optional_fields": [
-                "materials_needed",
-                "group_size",
-                "timing_hint",
-                "notes_for_teacher",
+ACTIVITY_TYPE_SEED_DATA: List[dict] = [
+    {
+        "type_name": "in-class-task",
+        "description": (
+            "Live classroom activity students do immediately (pair work, role-play, hands-on "
+            "practice)."
+        ),
+        "required_fields": ["steps"],
+        "optional_fields": [
+            "materials_needed",
+            "group_size",
+            "timing_hint",
+            "notes_for_teacher",
+        ],
+        "example_content_json": {
+            "steps": [
+                "Pair up with the person next to you.",
+                "Explain today's topic in your own words for 2 minutes.",
+                "Switch roles and repeat.",
+                "Each person writes one thing they still don't understand.",
             ],
-            "example_content_json": {
-                "steps": [
-                    "Pair up with the person next to you.",
-                    "Explain today's topic in your own words for 2 minutes.",
-                    "Switch roles and repeat.",
-                    "Each person writes one thing they still don't understand.",
-                ],
-                "materials_needed": ["timer", "paper", "pen"],
-                "group_size": 2,
-                "timing_hint": "2 min per student, ~5 min total",
-                "notes_for_teacher": "Walk around and listen for confusion patterns.",
-            },
+            "materials_needed": ["timer", "paper", "pen"],
+            "group_size": 2,
+            "timing_hint": "2 min per student, ~5 min total",
+            "notes_for_teacher": "Walk around and listen for confusion patterns.",
         },
-        {
-            "type_name": "worksheet",
-            "description": (
-                "Printable or digital scaffold (fill-in-the-blank, guided practice sheet, recap "
-                "template)."
-            ),
-            "required_fields": ["file_url"],
-            "optional_fields": ["instructions", "estimated_time_min", "materials_needed"],
-            "example_content_json": {
-                "file_url": "https://cdn.example.com/handouts/binary-search-recap.pdf",
-                "instructions": "Complete sections 1 and 2. Circle anything unclear.",
-                "estimated_time_min": 8,
-                "materials_needed": ["worksheet printout", "pencil"],
-            },
+    },
+    {
+        "type_name": "worksheet",
+        "description": (
+            "Printable or digital scaffold (fill-in-the-blank, guided practice sheet, recap "
+            "template)."
+        ),
+        "required_fields": ["file_url"],
+        "optional_fields": ["instructions", "estimated_time_min", "materials_needed"],
+        "example_content_json": {
+            "file_url": "https://cdn.example.com/handouts/binary-search-recap.pdf",
+            "instructions": "Complete sections 1 and 2. Circle anything unclear.",
+            "estimated_time_min": 8,
+            "materials_needed": ["worksheet printout", "pencil"],
         },
-        {
-            "type_name": "video",
-            "description": (
-                "Short clip, animation, or walkthrough. Usually used for visual learners or calm "
-                "focus."
-            ),
-            "required_fields": ["url"],
-            "optional_fields": ["duration_sec", "notes", "pause_points"],
-            "example_content_json": {
-                "url": "https://youtube.com/watch?v=dQw4w9WgXcQ",
-                "duration_sec": 180,
-                "notes": "Focus on how pointers move in the array.",
-                "pause_points": [
-                    {
-                        "timestamp_sec": 42,
-                        "prompt": "What changed between left and right pointers?",
-                    },
-                    {"timestamp_sec": 95, "prompt": "Why does mid move here?"},
-                ],
-            },
+    },
+    {
+        "type_name": "video",
+        "description": (
+            "Short clip, animation, or walkthrough. Usually used for visual learners or calm "
+            "focus."
+        ),
+        "required_fields": ["url"],
+        "optional_fields": ["duration_sec", "notes", "pause_points"],
+        "example_content_json": {
+            "url": "https://youtube.com/watch?v=dQw4w9WgXcQ",
+            "duration_sec": 180,
+            "notes": "Focus on how pointers move in the array.",
+            "pause_points": [
+                {
+                    "timestamp_sec": 42,
+                    "prompt": "What changed between left and right pointers?",
+                },
+                {"timestamp_sec": 95, "prompt": "Why does mid move here?"},
+            ],
         },
-        {
-            "type_name": "article",
-            "description": "Short reading (article, blog post, mini explainer, summary notes).",
-            "required_fields": ["url"],
-            "optional_fields": ["reading_time_min", "key_points", "reflection_questions"],
-            "example_content_json": {
-                "url": "https://example.com/intro-to-hash-tables-explained-for-beginners",
-                "reading_time_min": 5,
-                "key_points": [
-                    "Hash = fast lookup",
-                    "Collisions happen, we resolve them",
-                    "Real-world analogy: dictionary or phone book",
-                ],
-                "reflection_questions": [
-                    "Which part felt confusing?",
-                    "Where could you apply this concept?",
-                ],
-            },
+    },
+    {
+        "type_name": "article",
+        "description": "Short reading (article, blog post, mini explainer, summary notes).",
+        "required_fields": ["url"],
+        "optional_fields": ["reading_time_min", "key_points", "reflection_questions"],
+        "example_content_json": {
+            "url": "https://example.com/intro-to-hash-tables-explained-for-beginners",
+            "reading_time_min": 5,
+            "key_points": [
+                "Hash = fast lookup",
+                "Collisions happen, we resolve them",
+                "Real-world analogy: dictionary or phone book",
+            ],
+            "reflection_questions": [
+                "Which part felt confusing?",
+                "Where could you apply this concept?",
+            ],
         },
-        {
-            "type_name": "music",
-            "description": (
-                "Background audio or music track (usually instrumental, low-distraction). "
-                "Used to support calm focus, emotional regulation, or a specific activity mood."
+    },
+    {
+        "type_name": "music",
+        "description": (
+            "Background audio or music track (usually instrumental, low-distraction). "
+            "Used to support calm focus, emotional regulation, or a specific activity mood."
+        ),
+        "required_fields": ["url"],
+        "optional_fields": ["duration_sec", "notes"],
+        "example_content_json": {
+            "url": "https://www.youtube.com/watch?v=kGhHPX_TaI0",
+            "duration_sec": 10086,
+            "notes": (
+                "Soft instrumental track with steady beat and no lyrics. "
+                "Play quietly during independent work or reflection time. "
+                "You can start/stop at any time based on class needs."
             ),
-            "required_fields": ["url"],
-            "optional_fields": ["duration_sec", "notes"],
-            "example_content_json": {
-                "url": "https://www.youtube.com/watch?v=kGhHPX_TaI0",
-                "duration_sec": 10086,
-                "notes": (
-                    "Soft instrumental track with steady beat and no lyrics. "
-                    "Play quietly during independent work or reflection time. "
-                    "You can start/stop at any time based on class needs."
-                ),
-            },
         },
-    ]
+    },
+]
 
-    activity_seed_data = [
-        {
-            "name": "5 Steps to Wellbeing Animation",
-            "summary": (
-                "Animated video outlining five steps to improve mental health and wellbeing."
+ACTIVITY_SEED_DATA: List[dict] = [
+    {
+        "name": "5 Steps to Wellbeing Animation",
+        "summary": (
+            "Animated video outlining five steps to improve mental health and wellbeing."
+        ),
+        "type": "video",
+        "tags": ["wellbeing", "mental-health"],
+        "content_json": {
+            "url": "https://www.youtube.com/watch?v=x6bz_ekkrYA",
+            "duration_sec": 151,
+            "notes": (
+                "5 Steps to Wellbeing Animation — animated video outlining five steps to "
+                "improve mental health and wellbeing. After watching, you can act out "
+                "one step (e.g., talking to a friend) and use flags: green = I'll do it, "
+                "yellow = maybe, red = not yet."
             ),
-            "type": "video",
-            "tags": ["wellbeing", "mental-health"],
-            "content_json": {
-                "url": "https://www.youtube.com/watch?v=x6bz_ekkrYA",
-                "duration_sec": 151,
-                "notes": (
-                    "5 Steps to Wellbeing Animation — animated video outlining five steps to "
-                    "improve mental health and wellbeing. After watching, you can act out "
-                    "one step (e.g., talking to a friend) and use flags: green = I'll do it, "
-                    "yellow = maybe, red = not yet."
-                ),
-            },
         },
-        {
-            "name": "Wellbeing For Children: Confidence And Self-Esteem",
-            "summary": "Animation about confidence, self-esteem, and wellbeing.",
-            "type": "video",
-            "tags": ["wellbeing", "mental-health", "confidence", "__system_default__"],
-            "content_json": {
-                "url": "https://www.youtube.com/watch?v=pdjaxS4ME2A",
-                "duration_sec": 389,
-                "notes": (
-                    "Wellbeing For Children: Confidence And Self-Esteem — animation about "
-                    "confidence, self-esteem and wellbeing. You and your classmates can role-play confident "
-                    "vs. unconfident body language and use flags green/yellow/red for how "
-                    "good the posture/behaviour is for wellbeing."
-                ),
-            },
+    },
+    {
+        "name": "Wellbeing For Children: Confidence And Self-Esteem",
+        "summary": "Animation about confidence, self-esteem, and wellbeing.",
+        "type": "video",
+        "tags": ["wellbeing", "mental-health", "confidence", SYSTEM_DEFAULT_TAG],
+        "content_json": {
+            "url": "https://www.youtube.com/watch?v=pdjaxS4ME2A",
+            "duration_sec": 389,
+            "notes": (
+                "Wellbeing For Children: Confidence And Self-Esteem — animation about "
+                "confidence, self-esteem and wellbeing. You and your classmates can role-play confident "
+                "vs. unconfident body language and use flags green/yellow/red for how "
+                "good the posture/behaviour is for wellbeing."
+            ),
         },
-        {
-            "name": "The Reflection in Me",
-            "summary": "Short film about self-image and self-acceptance.",
-            "type": "video",
-            "tags": ["wellbeing", "mental-health"],
-            "content_json": {
-                "url": "https://www.youtube.com/watch?v=D9OOXCu5XMg",
-                "duration_sec": 222,
-                "notes": (
-                    "The Reflection in Me — short about self-image and self-acceptance. "
-                    "You can complete a reflection (e.g., 'When I look in the mirror, "
-                    "I feel…') and optionally use flags to show how you feel about yourself."
-                ),
-            },
+    },
+    {
+        "name": "The Reflection in Me",
+        "summary": "Short film about self-image and self-acceptance.",
+        "type": "video",
+        "tags": ["wellbeing", "mental-health"],
+        "content_json": {
+            "url": "https://www.youtube.com/watch?v=D9OOXCu5XMg",
+            "duration_sec": 222,
+            "notes": (
+                "The Reflection in Me — short about self-image and self-acceptance. "
+                "You can complete a reflection (e.g., 'When I look in the mirror, "
+                "I feel…') and optionally use flags to show how you feel about yourself."
+            ),
         },
-        {
-            "name": "Music Track #1",
-            "summary": "Calm, repetitive, no-lyrics background music.",
-            "type": "music",
-            "tags": ["music", "background", "calm", "focus"],
-            "content_json": {
-                "url": "https://www.youtube.com/watch?v=GR6AMEE43AI",
-                "duration_sec": 36016,
-                "notes": (
-                    "Music Track #1 — calm, repetitive, no lyrics. Works as background music "
-                    "for independent work or calming transitions. You can start/stop at any time."
-                ),
-            },
+    },
+    {
+        "name": "Music Track #1",
+        "summary": "Calm, repetitive, no-lyrics background music.",
+        "type": "music",
+        "tags": ["music", "background", "calm", "focus"],
+        "content_json": {
+            "url": "https://www.youtube.com/watch?v=GR6AMEE43AI",
+            "duration_sec": 36016,
+            "notes": (
+                "Music Track #1 — calm, repetitive, no lyrics. Works as background music "
+                "for independent work or calming transitions. You can start/stop at any time."
+            ),
         },
-        {
-            "name": "Music Track #2",
-            "summary": "Soft, continuous melody with minimal volume changes.",
-            "type": "music",
-            "tags": ["music", "background", "calm"],
-            "content_json": {
-                "url": (
-                    "https://www.youtube.com/watch?v=Dgjry2bhl9g&list=RDDgjry2bhl9g&start_radio=1"
-                ),
-                "duration_sec": 1516,
-                "notes": (
-                    "Music Track #2 — soft, continuous melody with minimal volume changes. "
-                    "Good for emotional regulation and reducing anxiety while working. "
-                    "You can start/stop at any time."
-                ),
-            },
+    },
+    {
+        "name": "Music Track #2",
+        "summary": "Soft, continuous melody with minimal volume changes.",
+        "type": "music",
+        "tags": ["music", "background", "calm"],
+        "content_json": {
+            "url": (
+                "https://www.youtube.com/watch?v=Dgjry2bhl9g&list=RDDgjry2bhl9g&start_radio=1"
+            ),
+            "duration_sec": 1516,
+            "notes": (
+                "Music Track #2 — soft, continuous melody with minimal volume changes. "
+                "Good for emotional regulation and reducing anxiety while working. "
+                "You can start/stop at any time."
+            ),
         },
-        {
-            "name": "Personal World Map",
-            "summary": "Quickly sketch a map of your personal world showing 3-5 important places.",
-            "type": "worksheet",
-            "tags": [
-                "unit-1",
-                "map-your-world",
-                "geography",
-                "self-reflection",
-                "solo",
-                "visual",
-                "creative",
-                "active",
-            ],
-            "content_json": {
-                "file_url": "https://classconnect-static-files.s3.us-east-1.amazonaws.com/personal-world-map.pdf",
-                "instructions": (
-                    "Draw a map of your personal world showing important places in your life.\n"
-                    "1. Draw your home in the center of the map\n"
-                    "2. Add your school\n"
-                    "3. Add 1-3 other important places (park, friend's house, library,\n"
-                    "   store, etc.)\n"
-                    "4. Draw a compass rose showing North (N), South (S), East (E), and West (W)\n"
-                    "5. Label each place clearly\n\n"
-                    "Remember: This is YOUR world map - include places that matter to you!"
-                ),
-                "estimated_time_min": 5,
-                "materials_needed": ["worksheet printout or blank paper", "pencil"],
-            },
+    },
+    {
+        "name": "Personal World Map",
+        "summary": "Quickly sketch a map of your personal world showing 3-5 important places.",
+        "type": "worksheet",
+        "tags": [
+            "unit-1",
+            "map-your-world",
+            "geography",
+            "self-reflection",
+            "solo",
+            "visual",
+            "creative",
+            "active",
+        ],
+        "content_json": {
+            "file_url": "https://classconnect-static-files.s3.us-east-1.amazonaws.com/personal-world-map.pdf",
+            "instructions": (
+                "Draw a map of your personal world showing important places in your life.\n"
+                "1. Draw your home in the center of the map\n"
+                "2. Add your school\n"
+                "3. Add 1-3 other important places (park, friend's house, library,\n"
+                "   store, etc.)\n"
+                "4. Draw a compass rose showing North (N), South (S), East (E), and West (W)\n"
+                "5. Label each place clearly\n\n"
+                "Remember: This is YOUR world map - include places that matter to you!"
+            ),
+            "estimated_time_min": 5,
+            "materials_needed": ["worksheet printout or blank paper", "pencil"],
         },
-        {
-            "name": "Map Reading Practice",
-            "summary": "Quick practice identifying map symbols and reading directions.",
-            "type": "worksheet",
-            "tags": [
-                "unit-1",
-                "map-your-world",
-                "geography",
-                "map-skills",
-                "solo",
-                "structured",
-                "passive",
-            ],
-            "content_json": {
-                "file_url": "https://classconnect-static-files.s3.us-east-1.amazonaws.com/map-reading-practice.pdf",
-                "instructions": (
-                    "Part 1: Match the symbol with its meaning (draw a line to connect)\n"
-                    "🏠 → House/Building\n"
-                    "🌳 → Park/Forest\n"
-                    "🛣️ → Road\n"
-                    "🏫 → School\n"
-                    "🏥 → Hospital\n\n"
-                    "Part 2: Compass Directions\n"
-                    "1. If you face North, which direction is to your right? __________\n"
-                    "2. If you face South, which direction is behind you? __________\n"
-                    "3. If you go East, then turn right, which direction are you facing? __________"
-                ),
-                "estimated_time_min": 5,
-                "materials_needed": ["worksheet printout", "pencil"],
-            },
+    },
+    {
+        "name": "Map Reading Practice",
+        "summary": "Quick practice identifying map symbols and reading directions.",
+        "type": "worksheet",
+        "tags": [
+            "unit-1",
+            "map-your-world",
+            "geography",
+            "map-skills",
+            "solo",
+            "structured",
+            "passive",
+        ],
+        "content_json": {
+            "file_url": "https://classconnect-static-files.s3.us-east-1.amazonaws.com/map-reading-practice.pdf",
+            "instructions": (
+                "Part 1: Match the symbol with its meaning (draw a line to connect)\n"
+                "🏠 → House/Building\n"
+                "🌳 → Park/Forest\n"
+                "🛣️ → Road\n"
+                "🏫 → School\n"
+                "🏥 → Hospital\n\n"
+                "Part 2: Compass Directions\n"
+                "1. If you face North, which direction is to your right? __________\n"
+                "2. If you face South, which direction is behind you? __________\n"
+                "3. If you go East, then turn right, which direction are you facing? __________"
+            ),
+            "estimated_time_min": 5,
+            "materials_needed": ["worksheet printout", "pencil"],
         },
-        {
-            "name": "Body Systems Quick Check",
-            "summary": "Quick review of major body systems.",
-            "type": "worksheet",
-            "tags": [
-                "unit-3",
-                "anatomy",
-                "physiology",
-                "body-systems",
-                "solo",
-                "structured",
-                "passive",
-            ],
-            "content_json": {
-                "file_url": "https://classconnect-static-files.s3.us-east-1.amazonaws.com/body-systems-quick-check.pdf",
-                "instructions": (
-                    "Part 1: Match the body system with its main function\n"
-                    "1. Circulatory System    → A. Moves blood through the body\n"
-                    "2. Respiratory System   → B. Takes in oxygen and removes carbon dioxide\n"
-                    "3. Digestive System    → C. Breaks down food for energy\n"
-                    "4. Nervous System      → D. Controls body functions and sends messages\n"
-                    "5. Skeletal System     → E. Provides structure and support\n\n"
-                    "Part 2: Which system works with the circulatory system to deliver oxygen?\n"
-                    "Circle your answer: Respiratory System  /  Digestive System  /  Nervous System"
-                ),
-                "estimated_time_min": 5,
-                "materials_needed": ["worksheet printout", "pencil"],
-            },
+    },
+    {
+        "name": "Body Systems Quick Check",
+        "summary": "Quick review of major body systems.",
+        "type": "worksheet",
+        "tags": [
+            "unit-3",
+            "anatomy",
+            "physiology",
+            "body-systems",
+            "solo",
+            "structured",
+            "passive",
+        ],
+        "content_json": {
+            "file_url": "https://classconnect-static-files.s3.us-east-1.amazonaws.com/body-systems-quick-check.pdf",
+            "instructions": (
+                "Part 1: Match the body system with its main function\n"
+                "1. Circulatory System    → A. Moves blood through the body\n"
+                "2. Respiratory System   → B. Takes in oxygen and removes carbon dioxide\n"
+                "3. Digestive System    → C. Breaks down food for energy\n"
+                "4. Nervous System      → D. Controls body functions and sends messages\n"
+                "5. Skeletal System     → E. Provides structure and support\n\n"
+                "Part 2: Which system works with the circulatory system to deliver oxygen?\n"
+                "Circle your answer: Respiratory System  /  Digestive System  /  Nervous System"
+            ),
+            "estimated_time_min": 5,
+            "materials_needed": ["worksheet printout", "pencil"],
         },
-        {
-            "name": "Body Systems Reading",
-            "summary": "Read a short article about how body systems work together.",
-            "type": "article",
-            "tags": [
-                "unit-3",
-                "anatomy",
-                "physiology",
-                "reading",
-                "solo",
-                "passive",
-                "structured",
+    },
+    {
+        "name": "Body Systems Reading",
+        "summary": "Read a short article about how body systems work together.",
+        "type": "article",
+        "tags": [
+            "unit-3",
+            "anatomy",
+            "physiology",
+            "reading",
+            "solo",
+            "passive",
+            "structured",
+        ],
+        "content_json": {
+            "url": "https://www.verywellhealth.com/organ-system-1298691",
+            "reading_time_min": 3,
+            "key_points": [
+                "The body has 11 major organ systems",
+                "Systems work together to maintain health",
+                "Example: circulatory and respiratory systems deliver oxygen",
+            ],
+            "reflection_questions": [
+                "Name two systems that work together. How?",
             ],
-            "content_json": {
-                "url": "https://www.verywellhealth.com/organ-system-1298691",
-                "reading_time_min": 3,
-                "key_points": [
-                    "The body has 11 major organ systems",
-                    "Systems work together to maintain health",
-                    "Example: circulatory and respiratory systems deliver oxygen",
-                ],
-                "reflection_questions": [
-                    "Name two systems that work together. How?",
-                ],
-            },
         },
-        {
-            "name": "Quick Relationship Reflection",
-            "summary": "Quick 5-minute reflection on your relationships.",
-            "type": "in-class-task",
-            "tags": [
-                "unit-6",
-                "relationships",
-                "reflection",
-                "solo",
-                "structured",
-                "passive",
+    },
+    {
+        "name": "Quick Relationship Reflection",
+        "summary": "Quick 5-minute reflection on your relationships.",
+        "type": "in-class-task",
+        "tags": [
+            "unit-6",
+            "relationships",
+            "reflection",
+            "solo",
+            "structured",
+            "passive",
+        ],
+        "content_json": {
+            "steps": [
+                "List 3 important relationships in your life",
+                "Write one thing you appreciate about each relationship",
+                "Write one way you can strengthen one relationship this week",
             ],
-            "content_json": {
-                "steps": [
-                    "List 3 important relationships in your life",
-                    "Write one thing you appreciate about each relationship",
-                    "Write one way you can strengthen one relationship this week",
-                ],
-                "materials_needed": ["paper", "pen or pencil"],
-                "group_size": 1,
-                "timing_hint": "5 minutes total",
-                "notes_for_teacher": (
-                    "This is a solo reflection activity. Students can work at their own pace."
-                ),
-            },
+            "materials_needed": ["paper", "pen or pencil"],
+            "group_size": 1,
+            "timing_hint": "5 minutes total",
+            "notes_for_teacher": (
+                "This is a solo reflection activity. Students can work at their own pace."
+            ),
         },
+    },
+]
+
+
+class SeedManifest(NamedTuple):
+    surveys: List[dict]
+    activity_types: List[dict]
+    activities: List[dict]
+
+
+FULL_MANIFEST = SeedManifest(
+    SURVEY_SPECS, ACTIVITY_TYPE_SEED_DATA, ACTIVITY_SEED_DATA)
+
+
+def _check_known(kind: str, requested: Iterable[str], known: Iterable[str]) -> None:
+    unknown = sorted(set(requested) - set(known))
+    if unknown:
+        raise ValueError(f"Unknown {kind} selector(s): {', '.join(unknown)}")
+
+
+def select_manifest(
+    tags: Sequence[str] = (),
+    types: Sequence[str] = (),
+    surveys: Sequence[str] = (),
+) -> SeedManifest:
+    """Slice the deploy manifest by activity tag, activity type, or survey title.
+
+    With no selectors the full manifest is returned. Otherwise only the selected
+    parts are seeded, plus their dependencies: the activity types referenced by
+    selected activities, and the system-default activity whenever any activity
+    is selected.
+    """
+    if not (tags or types or surveys):
+        return FULL_MANIFEST
+    _check_known("tag", tags, {
+        tag for entry in ACTIVITY_SEED_DATA for tag in entry["tags"]})
+    _check_known("type", types, {
+        entry["type_name"] for entry in ACTIVITY_TYPE_SEED_DATA})
+    _check_known("survey", surveys, {spec["title"] for spec in SURVEY_SPECS})
+
+    activities = [
+        entry for entry in ACTIVITY_SEED_DATA
+        if entry["type"] in types or set(entry["tags"]) & set(tags)
     ]
+    if activities:
+        activities = [
+            entry for entry in ACTIVITY_SEED_DATA
+            if entry in activities or SYSTEM_DEFAULT_TAG in entry["tags"]
+        ]
+    needed_types = set(types) | {entry["type"] for entry in activities}
+    return SeedManifest(
+        surveys=[spec for spec in SURVEY_SPECS if spec["title"] in surveys],
+        activity_types=[
+            entry for entry in ACTIVITY_TYPE_SEED_DATA
+            if entry["type_name"] in needed_types
+        ],
+        activities=activities,
+    )
+
+
+# Session-level lock key shared by every seed_deploy.py run against the same
+# database. The admin seed route runs scripts/seed.py, which does not take it.
+SEED_ADVISORY_LOCK_KEY = int.from_bytes(
+    hashlib.sha256(b"classconnect:deploy-seed").digest()[:8], "big", signed=True
+)
+_process_seed_lock = threading.Lock()
+
+try:  # POSIX only; other platforms fall back to the in-process lock.
+    import fcntl
+except ImportError:  # pragma: no cover - platform dependent
+    fcntl = None
+
+
+@contextmanager
+def seed_lock(bind: Engine) -> Iterator[bool]:
+    """Serialize ``seed_deploy.py`` runs across processes that share the database.
+
+    PostgreSQL uses a session-level advisory lock; a file-backed SQLite database
+    uses an flock on ``<database>.seed.lock``; anything else (in-memory SQLite,
+    other dialects) only serializes threads in this process. Yields whether the
+    caller had to wait for another seeder.
+    """
+    if bind.dialect.name == "postgresql":
+        with bind.connect() as conn:
+            waited = not conn.execute(
+                select(func.pg_try_advisory_lock(SEED_ADVISORY_LOCK_KEY))).scalar()
+            if waited:
+                print("⏳ Another process is seeding; waiting for it to finish…")
+                conn.execute(select(func.pg_advisory_lock(SEED_ADVISORY_LOCK_KEY)))
+            conn.commit()
+            try:
+                yield waited
+            finally:
+                conn.execute(
+                    select(func.pg_advisory_unlock(SEED_ADVISORY_LOCK_KEY)))
+                conn.commit()
+        return
+
+    database = bind.url.database if bind.dialect.name == "sqlite" else None
+    if fcntl is None or not database or database == ":memory:":
+        if bind.dialect.name != "sqlite":
+            warnings.warn(
+                f"No cross-process seed lock for dialect {bind.dialect.name!r}; "
+                "only threads in this process are serialized."
+            )
+        waited = not _process_seed_lock.acquire(blocking=False)
+        if waited:
+            _process_seed_lock.acquire()
+        try:
+            yield waited
+        finally:
+            _process_seed_lock.release()
+        return
+
+    with open(f"{database}.seed.lock", "w") as handle:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            waited = False
+        except BlockingIOError:
+            print("⏳ Another process is seeding; waiting for it to finish…")
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            waited = True
+        try:
+            yield waited
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+# Kept out of the app metadata so table-truncating resets leave the stamp alone;
+# the probe in seed_stamp_is_current() catches data wiped underneath it. The table
+# is created by an Alembic migration (see README-BACKEND.md), never by this script.
+seed_state_metadata = MetaData()
+seed_state_table = Table(
+    "seed_state",
+    seed_state_metadata,
+    Column("name", String(50), primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+    Column("schema_revision", String(255)),
+    Column("seeded_at", DateTime(timezone=True), nullable=False),
+)
+alembic_version_table = table("alembic_version", column("version_num"))
+SEED_STAMP_NAME = "deploy"
+
+
+def manifest_fingerprint(manifest: SeedManifest) -> str:
+    """Return a stable SHA-256 of the manifest contents."""
+    payload = json.dumps(
+        [manifest._asdict(), SYSTEM_DEFAULT_ACTIVITY_ID],
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _manifest_probe(manifest: SeedManifest):
+    """A cheap EXISTS proving the seeded rows are still there, or None."""
+    if manifest.activities:
+        return select(base_seed.Activity.id).where(
+            base_seed.Activity.id == SYSTEM_DEFAULT_ACTIVITY_ID).exists()
+    if manifest.surveys:
+        return select(base_seed.SurveyTemplate.id).where(
+            base_seed.SurveyTemplate.title == manifest.surveys[0]["title"]).exists()
+    return None
+
+
+def _has_table(db: Session, name: str) -> bool:
+    return sqlalchemy_inspect(db.connection()).has_table(name)
+
+
+def _current_schema_revision(db: Session) -> Optional[str]:
+    """The Alembic revision, or None for databases built without Alembic.
+
+    With several heads every revision is returned, sorted and comma-joined, so
+    the value does not depend on the order the database returns the rows in.
+    """
+    if not _has_table(db, alembic_version_table.name):
+        return None
+    revisions = sorted(db.execute(select(alembic_version_table.c.version_num)).scalars())
+    return ",".join(revisions) or None
+
+
+def seed_stamp_is_current(
+    db: Session, fingerprint: str, manifest: SeedManifest
+) -> Tuple[bool, Optional[str]]:
+    """Compare the stored stamp with ``fingerprint`` and the live schema revision.
+
+    The stamp and the data probe are read in one SELECT; the revision is looked
+    up separately so databases without ``alembic_version`` still match (both
+    sides are None). Returns ``(matches, current_revision)``.
+    """
+    live_revision = _current_schema_revision(db)
+    if not _has_table(db, seed_state_table.name):
+        return False, live_revision
+    probe = _manifest_probe(manifest)
+    row = db.execute(select(
+        seed_state_table.c.fingerprint,
+        seed_state_table.c.schema_revision,
+        probe if probe is not None else literal(True),
+    ).where(seed_state_table.c.name == SEED_STAMP_NAME)).first()
+    if row is None:
+        return False, live_revision
+    stored_fingerprint, stored_revision, data_present = row
+    matches = (
+        stored_fingerprint == fingerprint
+        and stored_revision == live_revision
+        and bool(data_present)
+    )
+    return matches, live_revision
+
+
+def clear_seed_stamp(db: Session) -> bool:
+    """Delete the deploy stamp row; returns False when ``seed_state`` is missing.
+
+    The caller commits this before resetting, so an interrupted reset or purge
+    never leaves a stamp that still matches the manifest.
+    """
+    if not _has_table(db, seed_state_table.name):
+        return False
+    db.execute(delete(seed_state_table).where(
+        seed_state_table.c.name == SEED_STAMP_NAME))
+    return True
+
+
+def write_seed_stamp(db: Session, fingerprint: str, schema_revision: Optional[str]) -> None:
+    if not clear_seed_stamp(db):
+        print("ℹ️  seed_state table missing (run migrations); seed stamp not written.")
+        return
+    db.execute(insert(seed_state_table).values(
+        name=SEED_STAMP_NAME,
+        fingerprint=fingerprint,
+        schema_revision=schema_revision,
+        seeded_at=datetime.now(timezone.utc),
+    ))
+
+
+class StatementCounter:
+    """Count the SQL statements sent to the database while the context is active.
+
+    Hooks ``before_cursor_execute`` so a batched executemany counts once per round
+    trip, which is what statement budgets are meant to bound. Time spent inside
+    the driver is summed into ``db_seconds``.
+    """
+
+    def __init__(self, bind: Engine = engine) -> None:
+        self.bind = bind
+        self.statements: List[str] = []
+        self.db_seconds = 0.0
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __enter__(self) -> "StatementCounter":
+        event.listen(self.bind, "before_cursor_execute", self._on_execute)
+        event.listen(self.bind, "after_cursor_execute", self._on_executed)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.bind, "before_cursor_execute", self._on_execute)
+        event.remove(self.bind, "after_cursor_execute", self._on_executed)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+        conn.info.setdefault("statement_started", []).append(time.perf_counter())
+
+    def _on_executed(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.get("statement_started")
+        if started:
+            self.db_seconds += time.perf_counter() - started.pop()
+
+    def assert_within(self, budget: int, label: str) -> None:
+        if self.count > budget:
+            listing = "\n  ".join(self.statements)
+            raise AssertionError(
+                f"{label} issued {self.count} statements (budget {budget}):\n  {listing}"
+            )
+
+
+def statement_budget(rows: int, batch_size: int = ORM_INSERT_BATCH_SIZE, overhead: int = 1) -> int:
+    """Allowed statements for inserting ``rows`` rows: ceil(rows / batch) + overhead."""
+    return math.ceil(rows / batch_size) + overhead
 
-    existing_types = {row.type_name: row for row in db.query(
-        base_seed.ActivityType).all()}
-    for entry in activity_type_seed_data:
+
+@contextmanager
+def statement_budget_guard(
+    label: str, budget: int, bind: Engine = engine
+) -> Iterator[StatementCounter]:
+    """Fail with AssertionError when the wrapped block exceeds ``budget`` statements."""
+    with StatementCounter(bind) as counter:
+        yield counter
+    counter.assert_within(budget, label)
+
+
+class SeedProfiler:
+    """Opt-in instrumentation around the seed phases.
+
+    Every option is off by default, in which case :meth:`session` and :meth:`phase`
+    are no-ops. ``flamegraph_path`` enables a stack sampler that writes folded
+    stacks (``frame;frame;frame count``) with the current phase as the root frame.
+    ``metrics_path`` records per-phase timings and SQL counts and writes them as
+    Prometheus text when the session ends. Statements are counted on the bind
+    passed to :meth:`phase`, falling back to ``bind``.
+    """
+
+    def __init__(
+        self,
+        profile_path: Optional[Path] = None,
+        trace_memory: bool = False,
+        flamegraph_path: Optional[Path] = None,
+        sample_interval: float = 0.005,
+        metrics_path: Optional[Path] = None,
+        bind: Engine = engine,
+    ) -> None:
+        self.profile_path = profile_path
+        self.trace_memory = trace_memory
+        self.flamegraph_path = flamegraph_path
+        self.sample_interval = sample_interval
+        self.metrics_path = metrics_path
+        self.bind = bind
+        self.current_phase = "seed"
+        self.phase_metrics: Dict[str, Dict[str, float]] = {}
+        self._samples: Counter = Counter()
+        self._stop_sampling = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(
+            self.profile_path
+            or self.trace_memory
+            or self.flamegraph_path
+            or self.metrics_path
+        )
+
+    @contextmanager
+    def session(self) -> Iterator["SeedProfiler"]:
+        if not self.enabled:
+            yield self
+            return
+        profile = cProfile.Profile() if self.profile_path else None
+        sampler = None
+        if self.flamegraph_path:
+            sampler = threading.Thread(
+                target=self._sample, args=(threading.get_ident(),), daemon=True)
+            sampler.start()
+        if self.trace_memory:
+            tracemalloc.start()
+        if profile:
+            profile.enable()
+        try:
+            yield self
+        finally:
+            if profile:
+                profile.disable()
+                profile.dump_stats(str(self.profile_path))
+                print(f"📊 cProfile stats written to {self.profile_path}")
+            if self.trace_memory:
+                tracemalloc.stop()
+            if sampler:
+                self._stop_sampling.set()
+                sampler.join()
+                self._write_folded_stacks()
+            if self.metrics_path:
+                self._write_metrics()
+
+    @contextmanager
+    def phase(self, name: str, bind: Optional[Engine] = None) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        self.current_phase = name
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        counter = StatementCounter(bind or self.bind) if self.metrics_path else None
+        started = time.perf_counter()
+        try:
+            with counter or nullcontext():
+                yield
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics = {"duration_seconds": elapsed}
+            report = f"⏱️  {name}: {elapsed:.3f}s"
+            if counter is not None:
+                metrics["sql_statements"] = counter.count
+                metrics["db_seconds"] = counter.db_seconds
+                report += f", {counter.count} statements ({counter.db_seconds:.3f}s in DB)"
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                metrics["peak_memory_bytes"] = peak
+                report += f", peak {peak / (1024 * 1024):.1f} MiB"
+            print(report)
+            self.phase_metrics[name] = metrics
+            self.current_phase = "seed"
+
+    def render_metrics(self) -> str:
+        """Render recorded phase metrics in the Prometheus text exposition format."""
+        descriptions = {
+            "duration_seconds": "Wall time spent in the seed phase.",
+            "sql_statements": "SQL statements issued during the seed phase.",
+            "db_seconds": "Time spent executing SQL during the seed phase.",
+            "peak_memory_bytes": "Peak traced Python memory during the seed phase.",
+        }
+        lines = []
+        for metric, description in descriptions.items():
+            samples = [
+                (phase, values[metric])
+                for phase, values in self.phase_metrics.items()
+                if metric in values
+            ]
+            if not samples:
+                continue
+            name = f"classconnect_seed_phase_{metric}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(
+                f'{name}{{phase="{phase}"}} {value}' for phase, value in samples)
+        return "\n".join(lines) + "\n"
+
+    def _write_metrics(self) -> None:
+        # Write-then-rename so a textfile collector never scrapes a partial file.
+        path = Path(self.metrics_path)
+        staging = path.with_name(f"{path.name}.tmp")
+        staging.write_text(self.render_metrics(), encoding="utf-8")
+        os.replace(staging, path)
+        print(f"📈 Seed metrics written to {self.metrics_path}")
+
+    def _sample(self, thread_id: int) -> None:
+        while not self._stop_sampling.wait(self.sample_interval):
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                frame = frame.f_back
+            stack.append(self.current_phase)
+            self._samples[";".join(reversed(stack))] += 1
+
+    def _write_folded_stacks(self) -> None:
+        with open(self.flamegraph_path, "w", encoding="utf-8") as handle:
+            for stack, count in self._samples.most_common():
+                handle.write(f"{stack} {count}\n")
+        print(f"🔥 Folded stacks written to {self.flamegraph_path}")
+
+
+class SeedCancelled(Exception):
+    """Raised at a phase boundary when the seed has been cancelled."""
+
+
+class SeedProgress:
+    """Progress and cancellation handle passed to :func:`seed_data`.
+
+    The seeder reports its status, the current phase and per-table row counts;
+    readers (for example another thread of the same process) call :meth:`snapshot`.
+    Cancellation is honoured only at phase boundaries before the reset starts, so a
+    cancelled seed leaves the database untouched. Once the reset begins, the reset
+    and each seed phase commit on their own, so the seed runs to completion; a late
+    cancel is recorded but ignored.
+    """
+
+    def __init__(self) -> None:
+        self.status = "pending"
+        self.phase: Optional[str] = None
+        self.rows: Dict[str, int] = {}
+        self.error: Optional[str] = None
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.cancellable = True
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    def enter_phase(self, name: str) -> None:
+        with self._lock:
+            if self.cancellable and self._cancelled.is_set():
+                raise SeedCancelled(f"Seed cancelled before {name}")
+            self.phase = name
+
+    def enter_uncancellable_phase(self, name: str) -> None:
+        """Last cancellation point: enter ``name`` and run to completion from here."""
+        self.enter_phase(name)
+        with self._lock:
+            self.cancellable = False
+
+    def add_rows(self, table_name: str, count: int) -> None:
+        with self._lock:
+            self.rows[table_name] = self.rows.get(table_name, 0) + count
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def _start(self) -> None:
+        with self._lock:
+            self.status = "running"
+            self.started_at = datetime.now(timezone.utc)
+
+    def _finish(self, status: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.status = status
+            self.error = error
+            self.finished_at = datetime.now(timezone.utc)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "status": self.status,
+                "phase": self.phase,
+                "rows": dict(self.rows),
+                "error": self.error,
+                "cancel_requested": self._cancelled.is_set(),
+                "cancellable": self.cancellable,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+            }
+
+
+def purge_tables_in_batches(
+    db: Session,
+    batch_size: int = 5000,
+    progress: Optional[SeedProgress] = None,
+) -> Dict[str, int]:
+    """Delete every application row, children first, ``batch_size`` rows at a time.
+
+    Each batch commits on its own, so no single transaction grows with the data
+    and concurrent readers are only ever blocked for one batch. Tables outside
+    the app metadata (``alembic_version``, ``seed_state``) are left alone.
+    Returns the number of rows deleted per table.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    deleted: Dict[str, int] = {}
+    for app_table in reversed(base_seed.Activity.metadata.sorted_tables):
+        key_columns = list(app_table.primary_key.columns)
+        key = key_columns[0] if len(key_columns) == 1 else tuple_(*key_columns)
+        batch = select(*key_columns).limit(batch_size)
+        if len(key_columns) == 1:
+            batch = batch.scalar_subquery()
+        statement = delete(app_table).where(key.in_(batch))
+        total = 0
+        while True:
+            if progress is not None:
+                progress.enter_phase(f"purge:{app_table.name}")
+            removed = db.execute(statement).rowcount
+            db.commit()
+            total += removed
+            if progress is not None:
+                progress.add_rows(f"purged:{app_table.name}", removed)
+            if removed < batch_size:
+                break
+        deleted[app_table.name] = total
+        if total:
+            print(f"🧹 Purged {total} rows from {app_table.name}")
+    return deleted
+
+
+def seed_surveys(db: Session, specs: Sequence[dict] = SURVEY_SPECS) -> int:
+    """Insert the survey templates in ``specs`` whose titles are not already present.
+
+    Defaults to both legacy surveys. Returns the number of surveys inserted.
+    """
+    if not specs:
+        return 0
+    existing = {row.title: row for row in db.query(base_seed.SurveyTemplate).filter(
+        base_seed.SurveyTemplate.title.in_([spec["title"] for spec in specs]))}
+    inserted = 0
+    for spec in specs:
+        if spec["title"] in existing:
+            print(f"ℹ️  Survey already exists, skipping: {spec['title']}")
+            continue
+        survey = base_seed.SurveyTemplate(
+            id=str(uuid.uuid4()),
+            title=spec["title"],
+            # Copies keep row JSON from aliasing the manifest (and its fingerprint).
+            questions_json=copy.deepcopy(spec["questions"]),
+            creator_name="System Seed",
+            creator_id=None,
+            creator_email=SEED_CREATOR_EMAIL,
+        )
+        db.add(survey)
+        inserted += 1
+        print(f"📝 Survey added: {survey.title}")
+    db.commit()
+    return inserted
+
+
+class ActivitySeedResult(NamedTuple):
+    activities: Dict[str, base_seed.Activity]
+    inserted_types: int
+    inserted_activities: int
+
+
+def seed_activity_types_and_activities(
+    db: Session,
+    activity_types: Sequence[dict] = ACTIVITY_TYPE_SEED_DATA,
+    activities: Sequence[dict] = ACTIVITY_SEED_DATA,
+) -> ActivitySeedResult:
+    """Insert deploy activity types and associated activities.
+
+    Existing rows are looked up by the names being seeded only, so a partial
+    seed reads proportionally less. Returns every seeded activity by name plus
+    the number of types and activities actually inserted.
+    """
+    existing_types = {}
+    if activity_types:
+        existing_types = {row.type_name: row for row in db.query(base_seed.ActivityType).filter(
+            base_seed.ActivityType.type_name.in_(
+                [entry["type_name"] for entry in activity_types]))}
+    inserted_types = 0
+    for entry in activity_types:
         if entry["type_name"] in existing_types:
             print(
                 f"ℹ️  Activity type already exists, skipping: {entry['type_name']}")
             continue
-        db.add(base_seed.ActivityType(**entry))
+        db.add(base_seed.ActivityType(**copy.deepcopy(entry)))
+        inserted_types += 1
     db.commit()
 
     seed_creator = {
         "creator_id": None,
         "creator_name": "System Seed",
-        "creator_email": "seed@system.local",
+        "creator_email": SEED_CREATOR_EMAIL,
     }
 
-    existing_activities = {
-        row.name: row for row in db.query(base_seed.Activity).all()}
+    if not activities:
+        return ActivitySeedResult({}, inserted_types, 0)
+    existing_activities = {row.name: row for row in db.query(base_seed.Activity).filter(
+        base_seed.Activity.name.in_([entry["name"] for entry in activities]))}
     created: Dict[str, base_seed.Activity] = {}
-    for entry in activity_seed_data:
-        payload = {**entry, **seed_creator}
+    inserted_activities = 0
+    system_default_name: Optional[str] = None
+    for entry in activities:
+        # Explicit ids keep every row in one batched INSERT.
+        payload = {"id": str(uuid.uuid4()), **copy.deepcopy(entry), **seed_creator}
+        if SYSTEM_DEFAULT_TAG in entry["tags"]:
+            payload["id"] = SYSTEM_DEFAULT_ACTIVITY_ID
         if payload["name"] in existing_activities:
             print(f"ℹ️  Activity already exists, skipping: {payload['name']}")
             created[payload["name"]] = existing_activities[payload["name"]]
             continue
         activity = base_seed.Activity(**payload)
         db.add(activity)
-        db.flush()
+        inserted_activities += 1
         created[payload["name"]] = activity
+        if payload["id"] == SYSTEM_DEFAULT_ACTIVITY_ID:
+            system_default_name = payload["name"]
 
     db.commit()
     print("🎯 Deploy activity types & activities seeded.")
 
-    system_default_name = "Calm Reset Routine"
-    system_default = created.get(system_default_name) or existing_activities.get(
-        system_default_name
+    if system_default_name is not None:
+        # Read from the payload: touching the expired instance would re-SELECT it.
+        print(
+            f"⭐ System default activity: {system_default_name} "
+            f"(SYSTEM_DEFAULT_ACTIVITY_ID={SYSTEM_DEFAULT_ACTIVITY_ID})"
+        )
+    return ActivitySeedResult(created, inserted_types, inserted_activities)
+
+
+def extract_learning_style_categories(questions: Sequence[dict]) -> List[str]:
+    """Return the sorted learning-style categories scored by a survey's options."""
+    categories = {
+        category
+        for question in questions
+        for option in question.get("options", [])
+        for category in (option.get("scores") or {})
+    }
+    return sorted(categories)
+
+
+def _chunked(rows: List[dict], size: int) -> Iterator[List[dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _recommendation_grid(
+    categories: Sequence[str],
+    mood_labels: Sequence[str],
+    activities: Sequence[base_seed.Activity],
+) -> List[tuple]:
+    """Map every (style, mood) pair to a shared activity, preferring tag matches.
+
+    A style such as "Active learner" prefers activities tagged ``active``; moods
+    rotate through the matching candidates so each cell is not the same pick.
+    Only ``id`` and ``tags`` are read from each activity.
+    """
+    grid = []
+    for category in categories:
+        style_tag = category.split()[0].split("/")[0].lower()
+        candidates = [a for a in activities if style_tag in (a.tags or [])]
+        candidates = candidates or list(activities)
+        for index, mood in enumerate(mood_labels):
+            grid.append((category, mood, candidates[index % len(candidates)].id))
+    return grid
+
+
+def seed_courses(
+    db: Session,
+    *,
+    teacher_email: str,
+    count: int,
+    survey_title: str = DEFAULT_COURSE_SURVEY_TITLE,
+    mood_labels: Optional[Sequence[str]] = None,
+    title_prefix: str = "Course",
+    batch_size: int = BULK_INSERT_BATCH_SIZE,
+) -> int:
+    """Provision ``count`` courses with full recommendation grids in batched inserts.
+
+    Categories are extracted once from the survey, and every course points at the
+    shared seeded activities. Titles that already exist for the teacher are skipped.
+    Returns the number of courses created.
+    """
+    if count < 1:
+        raise ValueError(f"count must be a positive integer, got {count}")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+    moods = list(dict.fromkeys(
+        label.strip()
+        for label in (DEFAULT_COURSE_MOOD_LABELS if mood_labels is None else mood_labels)
+        if label.strip()
+    ))
+    if not moods:
+        raise ValueError("At least one non-blank mood label is required.")
+
+    teacher = (
+        db.query(base_seed.Teacher)
+        .filter(base_seed.Teacher.email == teacher_email)
+        .one_or_none()
     )
-    if system_default:
-        tags = list(system_default.tags or [])
-        if "__system_default__" not in tags:
-            tags.append("__system_default__")
-            system_default.tags = tags
-            db.add(system_default)
-            db.commit()
-            print("⭐ Marked Calm Reset Routine as system default activity.")
-    return created
+    if teacher is None:
+        raise ValueError(f"Teacher not found: {teacher_email}")
+    survey = (
+        db.query(base_seed.SurveyTemplate)
+        .filter(base_seed.SurveyTemplate.title == survey_title)
+        .one_or_none()
+    )
+    if survey is None:
+        raise ValueError(f"Survey not found: {survey_title}")
+    # Seeded catalog only (no teacher-authored rows), and only the grid's columns.
+    activities = (
+        db.query(base_seed.Activity.id, base_seed.Activity.tags)
+        .filter(
+            base_seed.Activity.creator_id.is_(None),
+            base_seed.Activity.creator_email == SEED_CREATOR_EMAIL,
+        )
+        .order_by(base_seed.Activity.name)
+        .all()
+    )
+    if not activities:
+        raise ValueError("No activities seeded; run the deploy seed first.")
 
+    categories = extract_learning_style_categories(survey.questions_json or [])
+    if not categories:
+        raise ValueError(f"Survey has no scored learning styles: {survey_title}")
+    grid = _recommendation_grid(categories, moods, activities)
 
-def seed_data() -> None:
+    existing_titles = {
+        title for (title,) in db.query(base_seed.Course.title).filter(
+            base_seed.Course.teacher_id == teacher.id
+        )
+    }
+    course_rows: List[dict] = []
+    recommendation_rows: List[dict] = []
+    for number in range(1, count + 1):
+        title = f"{title_prefix} {number:04d}"
+        if title in existing_titles:
+            continue
+        course_id = str(uuid.uuid4())
+        course_rows.append({
+            "id": course_id,
+            "title": title,
+            "teacher_id": teacher.id,
+            "baseline_survey_id": survey.id,
+            "learning_style_categories": categories,
+            "mood_labels": moods,
+            "requires_rebaseline": True,
+        })
+        recommendation_rows.extend(
+            {
+                "id": str(uuid.uuid4()),
+                "course_id": course_id,
+                "learning_style": category,
+                "mood": mood,
+                "activity_id": activity_id,
+                "is_auto": True,
+            }
+            for category, mood, activity_id in grid
+        )
+
+    for batch in _chunked(course_rows, batch_size):
+        db.execute(insert(base_seed.Course), batch)
+    for batch in _chunked(recommendation_rows, batch_size):
+        db.execute(insert(base_seed.CourseRecommendation), batch)
+    db.commit()
+    print(
+        f"🏫 Courses added: {len(course_rows)} "
+        f"({len(recommendation_rows)} recommendations, "
+        f"{count - len(course_rows)} skipped)"
+    )
+    return len(course_rows)
+
+
+def provision_courses(profiler: Optional[SeedProfiler] = None, **options) -> int:
+    profiler = profiler or SeedProfiler()
     db = SessionLocal()
     try:
-        print("🌱 Starting deploy seed…")
-        base_seed.reset_database(db)
-        seed_surveys(db)
-        seed_activity_types_and_activities(db)
-        db.commit()
-        print("🎉 Deploy dataset loaded successfully!")
+        print("🌱 Provisioning courses…")
+        with profiler.phase("seed_courses", db.get_bind()):
+            return seed_courses(db, **options)
     except Exception as exc:  # pragma: no cover - debugging aid
         db.rollback()
+        print(f"❌ Course provisioning failed: {exc}")
+        raise
+    finally:
+        db.close()
+
+
+def seed_data(
+    check_budgets: bool = False,
+    session_factory: sessionmaker = SessionLocal,
+    profiler: Optional[SeedProfiler] = None,
+    manifest: SeedManifest = FULL_MANIFEST,
+    force: bool = False,
+    progress: Optional[SeedProgress] = None,
+    batched_reset: Optional[int] = None,
+    use_lock: bool = True,
+) -> None:
+    """Reset the database and load the deploy dataset (or a slice of it).
+
+    With ``check_budgets`` each phase must stay within its statement budget, so an
+    N+1 regression in the seeder raises instead of silently slowing deploys.
+    ``session_factory`` lets callers seed a database other than the configured one,
+    ``profiler`` wraps each phase with the requested instrumentation, and
+    ``manifest`` (see :func:`select_manifest`) limits what gets seeded. Unless
+    ``force`` is set, a matching ``seed_state`` stamp skips the seed entirely.
+    Concurrent callers are serialized by :func:`seed_lock`; whoever waited reuses
+    the finished seed instead of running it again. ``progress`` receives phase and
+    row-count updates and can cancel the seed up until the reset begins. ``batched_reset``
+    swaps the reset for :func:`purge_tables_in_batches` with that batch size.
+    ``use_lock=False`` skips :func:`seed_lock` for databases nothing else can reach.
+    """
+    profiler = profiler or SeedProfiler()
+    progress = progress or SeedProgress()
+
+    def guard(label: str, budget: int):
+        if not check_budgets:
+            return nullcontext()
+        return statement_budget_guard(label, budget, db.get_bind())
+
+    db = session_factory()
+    progress._start()
+    try:
+        progress.enter_phase("check_seed_stamp")
+        fingerprint = manifest_fingerprint(manifest)
+        is_current, schema_revision = seed_stamp_is_current(
+            db, fingerprint, manifest)
+        if is_current and not force:
+            print("✅ Seed stamp matches; database already holds this dataset.")
+            return
+        # End the read transaction so waiting replicas hold no table locks that
+        # would block the lock holder's reset.
+        db.rollback()
+        progress.enter_phase("wait_for_seed_lock")
+        with seed_lock(db.get_bind()) if use_lock else nullcontext(False) as waited:
+            if waited or not force:
+                # Another replica may have finished the same seed while we waited.
+                is_current, schema_revision = seed_stamp_is_current(
+                    db, fingerprint, manifest)
+                if is_current:
+                    print("✅ Another process completed this seed; reusing it.")
+                    return
+            print("🌱 Starting deploy seed…")
+            progress.enter_uncancellable_phase("reset_database")
+            # Invalidate the stamp first: the reset and purge batches commit on
+            # their own, and only the final commit below makes it valid again.
+            clear_seed_stamp(db)
+            db.commit()
+            with profiler.phase("reset_database", db.get_bind()):
+                if batched_reset is not None:
+                    purge_tables_in_batches(db, batched_reset, progress)
+                else:
+                    base_seed.reset_database(db)
+            # One SELECT of existing titles, then batched INSERTs.
+            progress.enter_phase("seed_surveys")
+            with profiler.phase("seed_surveys", db.get_bind()), guard(
+                "seed_surveys", statement_budget(len(manifest.surveys))
+            ):
+                inserted_surveys = seed_surveys(db, manifest.surveys)
+            progress.add_rows("surveys", inserted_surveys)
+            # Existing types and activities are read once each.
+            progress.enter_phase("seed_activity_types_and_activities")
+            with profiler.phase("seed_activity_types_and_activities", db.get_bind()), guard(
+                "seed_activity_types_and_activities",
+                statement_budget(len(manifest.activity_types))
+                + statement_budget(len(manifest.activities)),
+            ):
+                result = seed_activity_types_and_activities(
+                    db, manifest.activity_types, manifest.activities)
+            progress.add_rows("activity_types", result.inserted_types)
+            progress.add_rows("activities", result.inserted_activities)
+            progress.enter_phase("write_seed_stamp")
+            write_seed_stamp(db, fingerprint, schema_revision)
+            db.commit()
+            print("🎉 Deploy dataset loaded successfully!")
+    except SeedCancelled as exc:
+        db.rollback()
+        progress._finish("cancelled")
+        print(f"🛑 {exc}")
+        raise
+    except Exception as exc:  # pragma: no cover - debugging aid
+        db.rollback()
+        progress._finish("failed", str(exc))
         print(f"❌ Seed failed: {exc}")
         raise
     finally:
         db.close()
+        if progress.status == "running":
+            progress._finish("succeeded")
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command")
+    courses = commands.add_parser(
+        "courses", help="Bulk-provision courses against the seeded catalog.")
+    courses.add_argument("--count", type=_positive_int, required=True)
+    courses.add_argument("--teacher-email", required=True)
+    courses.add_argument("--survey-title", default=DEFAULT_COURSE_SURVEY_TITLE)
+    courses.add_argument(
+        "--moods",
+        default=",".join(DEFAULT_COURSE_MOOD_LABELS),
+        help="Comma-separated mood labels.",
+    )
+    courses.add_argument("--title-prefix", default="Course")
+    courses.add_argument("--batch-size", type=_positive_int,
+                         default=BULK_INSERT_BATCH_SIZE)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reseed even when the seed_state stamp matches.",
+    )
+    parser.add_argument(
+        "--batched-reset",
+        type=_positive_int,
+        metavar="ROWS",
+        help="Reset by deleting at most ROWS rows per table per transaction.",
+    )
+    parser.add_argument(
+        "--check-budgets",
+        action="store_true",
+        help="Fail when a seed phase exceeds its SQL statement budget.",
+    )
+    selection = parser.add_argument_group(
+        "partial seeding", "Repeatable; with none given the full dataset is seeded.")
+    selection.add_argument("--tag", action="append", default=[],
+                           help="Seed activities carrying this tag (e.g. unit-1).")
+    selection.add_argument("--type", action="append", default=[],
+                           help="Seed this activity type and its activities.")
+    selection.add_argument("--survey", action="append", default=[],
+                           help="Seed the survey template with this title.")
+    profiling = parser.add_argument_group("profiling")
+    profiling.add_argument(
+        "--profile", type=Path, metavar="PATH",
+        help="Write cProfile stats (open with pstats or snakeviz).")
+    profiling.add_argument(
+        "--trace-memory", action="store_true",
+        help="Report tracemalloc peak memory for each phase.")
+    profiling.add_argument(
+        "--flamegraph", type=Path, metavar="PATH",
+        help="Sample stacks and write folded output for flamegraph.pl/speedscope.")
+    profiling.add_argument(
+        "--sample-interval", type=float, default=0.005, metavar="SECONDS")
+    profiling.add_argument(
+        "--metrics", type=Path, metavar="PATH",
+        help="Write per-phase timings and SQL counts in Prometheus text format.")
+    args = parser.parse_args(argv)
+
+    profiler = SeedProfiler(
+        profile_path=args.profile,
+        trace_memory=args.trace_memory,
+        flamegraph_path=args.flamegraph,
+        sample_interval=args.sample_interval,
+        metrics_path=args.metrics,
+    )
+    with profiler.session():
+        if args.command == "courses":
+            provision_courses(
+                profiler=profiler,
+                teacher_email=args.teacher_email,
+                count=args.count,
+                survey_title=args.survey_title,
+                mood_labels=args.moods.split(","),
+                title_prefix=args.title_prefix,
+                batch_size=args.batch_size,
+            )
+        else:
+            seed_data(
+                check_budgets=args.check_budgets,
+                force=args.force,
+                batched_reset=args.batched_reset,
+                profiler=profiler,
+                manifest=select_manifest(args.tag, args.type, args.survey),
+            )
 
 
 if __name__ == "__main__":
-    seed_data()
+    main()
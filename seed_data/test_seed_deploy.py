@@ -0,0 +1,328 @@
+"""Tests for the deploy seed script (run with the backend environment available)."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+import conftest
+import seed_deploy
+
+
+def test_extract_learning_style_categories_is_sorted_and_unique():
+    questions = [
+        {"id": "q1", "options": [{"label": "a", "scores": {"Visual": 1, "Active": 0}}]},
+        {"id": "q2", "options": [{"label": "b", "scores": {"Active": 2}}, {"label": "c"}]},
+    ]
+    assert seed_deploy.extract_learning_style_categories(questions) == ["Active", "Visual"]
+
+
+def test_seeded_survey_categories():
+    categories = seed_deploy.extract_learning_style_categories(
+        seed_deploy.SURVEY_1_QUESTIONS)
+    assert categories == ["Active learner", "Passive learner", "Structured learner"]
+
+
+def test_recommendation_grid_covers_every_cell_and_prefers_tag_matches():
+    activities = [
+        SimpleNamespace(id="a1", tags=["active"]),
+        SimpleNamespace(id="a2", tags=["active"]),
+        SimpleNamespace(id="p1", tags=["passive"]),
+    ]
+    grid = seed_deploy._recommendation_grid(
+        ["Active learner", "Buddy/Social learner"], ["Happy", "Sad", "Tired"], activities)
+
+    assert [(style, mood) for style, mood, _ in grid] == [
+        (style, mood)
+        for style in ["Active learner", "Buddy/Social learner"]
+        for mood in ["Happy", "Sad", "Tired"]
+    ]
+    active = [activity_id for style, _, activity_id in grid if style == "Active learner"]
+    assert active == ["a1", "a2", "a1"]
+    # No "buddy" tag: falls back to the whole catalog.
+    buddy = [activity_id for style, _, activity_id in grid if style.startswith("Buddy")]
+    assert buddy == ["a1", "a2", "p1"]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"count": 0},
+        {"count": -3},
+        {"count": 5, "mood_labels": []},
+        {"count": 5, "mood_labels": ["", "  "]},
+        {"count": 5, "batch_size": 0},
+    ],
+)
+def test_seed_courses_rejects_invalid_options(options):
+    with pytest.raises(ValueError):
+        seed_deploy.seed_courses(None, teacher_email="t@school.org", **options)
+
+
+def test_select_manifest_without_selectors_is_full():
+    assert seed_deploy.select_manifest() is seed_deploy.FULL_MANIFEST
+
+
+def test_select_manifest_by_tag_pulls_in_dependencies():
+    manifest = seed_deploy.select_manifest(tags=["unit-1"])
+    names = [entry["name"] for entry in manifest.activities]
+    assert names == [
+        "Wellbeing For Children: Confidence And Self-Esteem",
+        "Personal World Map",
+        "Map Reading Practice",
+    ]
+    assert {entry["type_name"] for entry in manifest.activity_types} == {"video", "worksheet"}
+    assert manifest.surveys == []
+
+
+def test_select_manifest_by_type_and_survey():
+    manifest = seed_deploy.select_manifest(
+        types=["music"], surveys=["Learning Buddy: Style Check"])
+    assert [spec["title"] for spec in manifest.surveys] == ["Learning Buddy: Style Check"]
+    assert {entry["type_name"] for entry in manifest.activity_types} == {"music", "video"}
+    assert all(
+        entry["type"] == "music" or seed_deploy.SYSTEM_DEFAULT_TAG in entry["tags"]
+        for entry in manifest.activities
+    )
+
+
+def test_select_manifest_survey_only_has_no_activities():
+    manifest = seed_deploy.select_manifest(surveys=["Critter Quest: Learning Adventure"])
+    assert manifest.activities == [] and manifest.activity_types == []
+
+
+def test_select_manifest_rejects_unknown_selectors():
+    with pytest.raises(ValueError, match="Unknown tag"):
+        seed_deploy.select_manifest(tags=["no-such-tag"])
+
+
+@pytest.fixture
+def sqlite_session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+    seed_deploy.base_seed.Activity.metadata.create_all(engine)
+    seed_deploy.seed_state_metadata.create_all(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def test_seed_data_stays_within_statement_budgets(sqlite_session_factory):
+    seed_deploy.seed_data(
+        check_budgets=True, force=True, session_factory=sqlite_session_factory)
+
+    db = sqlite_session_factory()
+    try:
+        assert db.query(seed_deploy.base_seed.SurveyTemplate).count() == len(
+            seed_deploy.SURVEY_SPECS)
+        assert db.query(seed_deploy.base_seed.Activity).count() == len(
+            seed_deploy.ACTIVITY_SEED_DATA)
+    finally:
+        db.close()
+
+
+def test_statement_budget_guard_fails_on_excess_statements(sqlite_session_factory):
+    db = sqlite_session_factory()
+    try:
+        with pytest.raises(AssertionError, match="issued 3 statements"):
+            with seed_deploy.statement_budget_guard("n+1", 2, db.get_bind()):
+                for _ in range(3):
+                    db.execute(text("SELECT 1"))
+    finally:
+        db.close()
+
+
+class _RecordingSession:
+    """Just enough of a Session for seed_surveys to run against nothing."""
+
+    def __init__(self):
+        self.added = []
+
+    def query(self, *entities):
+        return self
+
+    def filter(self, *criteria):
+        return self
+
+    def __iter__(self):
+        return iter([])
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    def commit(self):
+        pass
+
+
+def test_seeded_rows_do_not_share_json_with_the_manifest():
+    db = _RecordingSession()
+    seed_deploy.seed_surveys(db)
+
+    for survey, spec in zip(db.added, seed_deploy.SURVEY_SPECS):
+        assert survey.questions_json == spec["questions"]
+        assert survey.questions_json is not spec["questions"]
+
+
+def test_sqlite_template_is_seeded_once_and_cloned_per_test(seeded_template):
+    assert not seeded_template.with_name(f"{seeded_template.name}.seed.lock").exists()
+
+    first = conftest.sqlite_engine_from_template(seeded_template)
+    second = conftest.sqlite_engine_from_template(seeded_template)
+    try:
+        db = sessionmaker(bind=first)()
+        titles = {row.title for row in db.query(seed_deploy.base_seed.SurveyTemplate)}
+        assert titles == {spec["title"] for spec in seed_deploy.SURVEY_SPECS}
+        system_default = db.get(
+            seed_deploy.base_seed.Activity, seed_deploy.SYSTEM_DEFAULT_ACTIVITY_ID)
+        assert system_default is not None
+        db.query(seed_deploy.base_seed.Activity).delete()
+        db.commit()
+        db.close()
+
+        # Clones are independent copies of the template.
+        other = sessionmaker(bind=second)()
+        assert other.query(seed_deploy.base_seed.Activity).count() == len(
+            seed_deploy.ACTIVITY_SEED_DATA)
+        other.close()
+    finally:
+        first.dispose()
+        second.dispose()
+
+
+def test_documented_system_default_activity_id_matches_seed():
+    readme = Path(__file__).resolve().parent.parent / "README-BACKEND.md"
+    assert (
+        f"SYSTEM_DEFAULT_ACTIVITY_ID={seed_deploy.SYSTEM_DEFAULT_ACTIVITY_ID}"
+        in readme.read_text(encoding="utf-8")
+    )
+
+
+def test_matching_stamp_skips_reseed_without_alembic(sqlite_session_factory, capsys):
+    seed_deploy.seed_data(session_factory=sqlite_session_factory)
+    capsys.readouterr()
+
+    seed_deploy.seed_data(session_factory=sqlite_session_factory)
+
+    assert "Seed stamp matches" in capsys.readouterr().out
+
+
+def test_missing_stamp_table_seeds_without_creating_it(tmp_path, capsys):
+    engine = create_engine(f"sqlite:///{tmp_path / 'no-stamp.db'}")
+    seed_deploy.base_seed.Activity.metadata.create_all(engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    try:
+        seed_deploy.seed_data(session_factory=factory, use_lock=False)
+        seed_deploy.seed_data(session_factory=factory, use_lock=False)
+
+        output = capsys.readouterr().out
+        assert output.count("Starting deploy seed") == 2
+        assert not inspect(engine).has_table("seed_state")
+    finally:
+        engine.dispose()
+
+
+def test_cancel_is_honoured_only_before_the_reset():
+    early = seed_deploy.SeedProgress()
+    early.cancel()
+    with pytest.raises(seed_deploy.SeedCancelled):
+        early.enter_uncancellable_phase("reset_database")
+
+    late = seed_deploy.SeedProgress()
+    late.enter_uncancellable_phase("reset_database")
+    late.cancel()
+    late.enter_phase("seed_surveys")
+    snapshot = late.snapshot()
+    assert snapshot["phase"] == "seed_surveys"
+    assert snapshot["cancel_requested"] and not snapshot["cancellable"]
+
+
+def test_cancelled_seed_leaves_the_database_untouched(sqlite_session_factory):
+    progress = seed_deploy.SeedProgress()
+    progress.cancel()
+
+    with pytest.raises(seed_deploy.SeedCancelled):
+        seed_deploy.seed_data(session_factory=sqlite_session_factory, progress=progress)
+
+    assert progress.snapshot()["status"] == "cancelled"
+    db = sqlite_session_factory()
+    try:
+        assert db.query(seed_deploy.base_seed.SurveyTemplate).count() == 0
+    finally:
+        db.close()
+
+
+def test_progress_reports_inserted_rows(sqlite_session_factory):
+    first = seed_deploy.SeedProgress()
+    seed_deploy.seed_data(session_factory=sqlite_session_factory, progress=first)
+    snapshot = first.snapshot()
+    assert snapshot["status"] == "succeeded"
+    assert snapshot["rows"]["activities"] == len(seed_deploy.ACTIVITY_SEED_DATA)
+
+    db = sqlite_session_factory()
+    try:
+        assert seed_deploy.seed_surveys(db) == 0
+        result = seed_deploy.seed_activity_types_and_activities(db)
+        assert (result.inserted_types, result.inserted_activities) == (0, 0)
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_purge_rejects_non_positive_batch_size(batch_size):
+    with pytest.raises(ValueError, match="batch_size"):
+        seed_deploy.purge_tables_in_batches(None, batch_size)
+
+
+def test_interrupted_purge_leaves_no_matching_stamp(sqlite_session_factory, monkeypatch):
+    seed_deploy.seed_data(session_factory=sqlite_session_factory)
+
+    def crash(db, batch_size, progress=None):
+        db.execute(seed_deploy.delete(seed_deploy.base_seed.Activity.__table__))
+        db.commit()
+        raise RuntimeError("purge interrupted")
+
+    monkeypatch.setattr(seed_deploy, "purge_tables_in_batches", crash)
+    with pytest.raises(RuntimeError, match="purge interrupted"):
+        seed_deploy.seed_data(
+            session_factory=sqlite_session_factory, force=True, batched_reset=100)
+
+    db = sqlite_session_factory()
+    try:
+        is_current, _ = seed_deploy.seed_stamp_is_current(
+            db, seed_deploy.manifest_fingerprint(seed_deploy.FULL_MANIFEST),
+            seed_deploy.FULL_MANIFEST)
+        assert not is_current
+    finally:
+        db.close()
+
+
+def test_metrics_count_statements_on_the_seeded_database(sqlite_session_factory, tmp_path):
+    profiler = seed_deploy.SeedProfiler(metrics_path=tmp_path / "seed.prom")
+    with profiler.session():
+        seed_deploy.seed_data(session_factory=sqlite_session_factory, profiler=profiler)
+
+    assert profiler.phase_metrics["seed_surveys"]["sql_statements"] > 0
+    assert profiler.phase_metrics["seed_activity_types_and_activities"]["sql_statements"] > 0
+    assert 'phase="seed_surveys"' in (tmp_path / "seed.prom").read_text(encoding="utf-8")
+
+
+def test_schema_revision_is_stable_across_multiple_heads(sqlite_session_factory):
+    db = sqlite_session_factory()
+    try:
+        db.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)"))
+        db.execute(text("INSERT INTO alembic_version VALUES ('bbb222'), ('aaa111')"))
+        assert seed_deploy._current_schema_revision(db) == "aaa111,bbb222"
+    finally:
+        db.close()
+
+
+def test_metrics_file_is_replaced_atomically(tmp_path):
+    path = tmp_path / "seed.prom"
+    path.write_text("stale\n", encoding="utf-8")
+    profiler = seed_deploy.SeedProfiler(metrics_path=path)
+    profiler.phase_metrics["seed_surveys"] = {"duration_seconds": 0.5}
+
+    profiler._write_metrics()
+
+    assert 'phase="seed_surveys"} 0.5' in path.read_text(encoding="utf-8")
+    assert not (tmp_path / "seed.prom.tmp").exists()
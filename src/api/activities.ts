@@ -1,6 +1,10 @@
 import { apiClient } from './client'
 import type { Activity, ActivityType } from './types'
 
+// The activity catalog changes rarely (reseeds, teacher create/edit). Pages reuse
+// the cached copy for this long; create/edit mutations invalidate it immediately.
+export const CATALOG_STALE_TIME_MS = 5 * 60 * 1000
+
 export interface CreateActivityTypePayload {
   type_name: string
   description: string
@@ -41,7 +41,7 @@ import {
   FiLayers,
   FiChevronDown,
 } from 'react-icons/fi'
-import { listActivities, listActivityTypes } from '../../api/activities'
+import { listActivities, listActivityTypes, CATALOG_STALE_TIME_MS } from '../../api/activities'
 
 export function TeacherActivitiesPage() {
   const navigate = useNavigate()
@@ -51,11 +51,13 @@ export function TeacherActivitiesPage() {
   const activitiesQuery = useQuery({
     queryKey: ['activities'],
     queryFn: listActivities,
+    staleTime: CATALOG_STALE_TIME_MS,
   })
 
   const activityTypesQuery = useQuery({
     queryKey: ['activityTypes'],
     queryFn: listActivityTypes,
+    staleTime: CATALOG_STALE_TIME_MS,
   })
 
   const filteredActivities = useMemo(() => {
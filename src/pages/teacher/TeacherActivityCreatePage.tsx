@@ -46,7 +46,7 @@ import {
   FiAlertCircle,
   FiChevronDown,
 } from 'react-icons/fi'
-import { createActivity, listActivityTypes } from '../../api/activities'
+import { createActivity, listActivityTypes, CATALOG_STALE_TIME_MS } from '../../api/activities'
 import { ApiError } from '../../api/client'
 
 export function TeacherActivityCreatePage() {
@@ -62,6 +62,7 @@ export function TeacherActivityCreatePage() {
  const activityTypesQuery = useQuery({
     queryKey: ['activityTypes'],
     queryFn: listActivityTypes,
+    staleTime: CATALOG_STALE_TIME_MS,
   })
 
   const selectedType = useMemo(
@@ -28,7 +28,7 @@ import {
   FiCode,
   FiPlus,
 } from 'react-icons/fi'
-import { listActivityTypes } from '../../api/activities'
+import { listActivityTypes, CATALOG_STALE_TIME_MS } from '../../api/activities'
 
 export function TeacherActivityTypeDetailPage() {
   const { typeName } = useParams<{ typeName: string }>()
@@ -36,6 +36,7 @@ export function TeacherActivityTypeDetailPage() {
   const activityTypesQuery = useQuery({
     queryKey: ['activityTypes'],
     queryFn: listActivityTypes,
+    staleTime: CATALOG_STALE_TIME_MS,
   })
 
   if (activityTypesQuery.isLoading) {
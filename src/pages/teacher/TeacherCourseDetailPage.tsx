@@ -44,7 +44,7 @@ import {
   updateCourse,
   updateCourseRecommendations,
 } from '../../api/courses'
-import { listActivities } from '../../api/activities'
+import { listActivities, CATALOG_STALE_TIME_MS } from '../../api/activities'
 import { listSurveys } from '../../api/surveys'
 import { ApiError } from '../../api/client'
 
@@ -87,6 +87,7 @@ export function TeacherCourseDetailPage() {
   const activitiesQuery = useQuery({
     queryKey: ['activities'],
     queryFn: listActivities,
+    staleTime: CATALOG_STALE_TIME_MS,
   })
 
   const surveysQuery = useQuery({
@@ -50,7 +50,7 @@ import {
 import { useState, useMemo } from "react";
 import { listCourses } from "../../api/courses";
 import { listSurveys } from "../../api/surveys";
-import { listActivities } from "../../api/activities";
+import { listActivities, CATALOG_STALE_TIME_MS } from "../../api/activities";
 import { listCourseSessions, getSessionSubmissions } from "../../api/sessions";
 
 export function TeacherDashboardPage() {
@@ -88,6 +88,7 @@ export function TeacherDashboardPage() {
   const activitiesQuery = useQuery({
     queryKey: ["activities"],
     queryFn: listActivities,
+    staleTime: CATALOG_STALE_TIME_MS,
   });
 
   // Get all course IDs to fetch their sessions